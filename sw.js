@@ -0,0 +1,72 @@
+// Workout Tracker service worker
+// The app shell is precached under a versioned cache name so a launch
+// never waits on the network. Requests are answered from the cache
+// straight away and refreshed in the background (stale-while-revalidate);
+// the refreshed copy is what the next launch gets. Bump CACHE_VERSION
+// whenever the precache list changes.
+const CACHE_VERSION = 'v1';
+const CACHE_PREFIX = 'workout-tracker-';
+const CACHE_NAME = CACHE_PREFIX + CACHE_VERSION;
+const PRECACHE_URLS = [
+    './workout-tracker.html',
+    './manifest.webmanifest',
+    './icon.svg'
+];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+// Drop caches from older versions
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    if (request.method !== 'GET' || new URL(request.url).origin !== self.location.origin) return;
+    event.respondWith(staleWhileRevalidate(event));
+});
+
+async function staleWhileRevalidate(event) {
+    const cache = await caches.open(CACHE_NAME);
+    // Launches from the home screen may carry a query string
+    const cached = await cache.match(event.request, { ignoreSearch: true });
+
+    const network = fetch(event.request).then(response => {
+        if (response.ok) {
+            cache.put(event.request, response.clone());
+        }
+        return response;
+    });
+
+    if (cached) {
+        // Keep the worker alive until the refresh lands; offline is fine
+        event.waitUntil(network.catch(() => {}));
+        return cached;
+    }
+    return network;
+}
+
+// Tapping the rest timer notification brings the app back
+self.addEventListener('notificationclick', (event) => {
+    event.notification.close();
+    event.waitUntil(
+        self.clients.matchAll({ type: 'window' }).then(windows => {
+            if (windows.length > 0) {
+                return windows[0].focus();
+            }
+            return self.clients.openWindow('./workout-tracker.html');
+        })
+    );
+});